@@ -17,6 +17,9 @@
 from crewai import Agent, Crew, Process, Task, LLM
 from crewai.project import CrewBase, agent, crew, task
 
+# LLM with on-disk response cache (see llm_cache.py), set CREW_LLM_CACHE=0 to disable
+from llm_cache import CachedLLM
+
 # Import external tools for web search, scraping, and file I/O
 # from crewai_tools import SerperDevTool, ScrapeWebsiteTool, DirectoryReadTool, FileWriterTool, FileReadTool
 
@@ -33,11 +36,15 @@ class BlogCrew():
     agents_config = "config/agents.yaml"
     tasks_config = "config/tasks.yaml"
 
+    # Note: @agent and @task memoize the decorated methods, so calling self.researcher() from a task
+    # and again from crew() returns the same Agent instead of building a new one.
+
     # Define a researcher agent using a config from the YAML file
     @agent
     def researcher(self) -> Agent:
         return Agent(
             config=self.agents_config['research_agent'],  # Reference to YAML config for researcher
+            llm=CachedLLM(model=self.agents_config['research_agent']['llm']),  # Model from YAML, with response cache
             #tools=[SerperDevTool()],                      # Uses a web search tool
             verbose=True                                  # Enable detailed output
         )
@@ -47,6 +54,7 @@ class BlogCrew():
     def writer(self) -> Agent:
         return Agent(
             config=self.agents_config['writer_agent'],  # Reference to YAML config for writer
+            llm=CachedLLM(model=self.agents_config['writer_agent']['llm']),  # Model from YAML, with response cache
             verbose=True                                # Enable detailed output
         )
 
@@ -2,12 +2,13 @@
 from dotenv import load_dotenv
 load_dotenv()
 
-# Import the LLM wrapper from crewai
-from crewai import LLM
+# Import the LLM wrapper from crewai (with on-disk response cache, see llm_cache.py)
+from llm_cache import CachedLLM
+import asyncio
 import os
 
 # Initialize a Gemini model with low temperature (more deterministic output)
-llm = LLM(
+llm = CachedLLM(
     model="gemini/gemini-2.0-flash",
     temperature=0.1
 )
@@ -16,60 +17,118 @@ llm = LLM(
 from crewai import Agent, Task, Crew
 # from crewai_tools import SerperDevTool  # Optional tool for web search (commented out)
 
-# Define the research agent responsible for gathering factual data
-research_agent = Agent(
-    role="Research Specialist",  # Agent's role
-    goal="Research interesting facts about the topic: {topic}",  # Dynamic goal based on topic
-    backstory="You are an expert at finding relevant and factual data.",  # Describes agent's personality
-    # tools=[SerperDevTool()],  # Tool for live search (currently not used)
-    verbose=True,  # Enables detailed output/logging
-    llm=llm        # Assigns the LLM to the agent
-)
-
-# Define the writer agent responsible for producing the blog summary
-writer_agent = Agent(
-    role="Creative Writer",  # Agent's role
-    goal="Write a short blog summary using the research",  # Goal using input from research agent
-    backstory="You are skilled at writing engaging summaries based on provided content.",  # Agent’s skill description
-    llm=llm,
-    verbose=True
-)
-
-# First task: instruct research agent to find recent interesting facts
-task1 = Task(
-    description="Find 3-5 interesting and recent facts about {topic} as of year 2025.",
-    expected_output="A bullet list of 3-5 facts",
-    agent=research_agent
-)
-
-# Second task: instruct writer to use the research and create a blog post
-task2 = Task(
-    description="Write a 100-word blog post summary about {topic} using the facts from the research.",
-    expected_output="A blog post summary",
-    agent=writer_agent,
-    context=[task1]  # Uses the output from task1 as input
-)
-
-# Define the crew that brings together both agents and tasks
-crew = Crew(
-    agents=[research_agent, writer_agent],  # List of agents in the workflow
-    tasks=[task1, task2],                   # List of tasks to perform
-    verbose=True,                           # Enables logging
-    memory=True,                            # Enables memory so agents retain context between tasks
-    embedder={                              # Embedder configuration for semantic memory
-        "provider": "google",
-        "config": {
-            "api_key": os.getenv("GEMINI_API_KEY"),  # Retrieves API key from .env
-            "model": "text-embedding-004"            # Embedding model for context memory (https://docs.crewai.com/en/concepts/memory)
-        }
+# Embedding function interface used by CrewAI's memory storage (Chroma)
+from chromadb import Documents, EmbeddingFunction, Embeddings
+from functools import lru_cache
+
+# Local embedder for short-term memory: a small quantized ONNX model run on the CPU by fastembed.
+# Short-term memory is written after every agent step, and a local model embeds a text in a few
+# milliseconds without the ~100 ms network round-trip to the Gemini API.
+class FastEmbedEmbedder(EmbeddingFunction):
+    def __init__(self, model: str = "BAAI/bge-small-en-v1.5"):
+        from fastembed import TextEmbedding  # pip install fastembed
+        self.model = TextEmbedding(model_name=model)
+
+    def __call__(self, input: Documents) -> Embeddings:
+        return [vector.tolist() for vector in self.model.embed(list(input))]
+
+# Embedder configs shared by every crew
+# Note: CrewAI saves and searches memory one text at a time, so there is nothing to batch per embedding request
+embedder_config = {
+    "provider": "google",
+    "config": {
+        "api_key": os.getenv("GEMINI_API_KEY"),  # Retrieves API key from .env
+        "model": "text-embedding-004"            # Embedding model for context memory (https://docs.crewai.com/en/concepts/memory)
     }
-)
-
-# Run the full crew workflow with a topic about electric vehicles
-crew.kickoff(inputs={"topic": "The future of electrical vehicles"})
-
-# Run the same crew again with a different topic; memory will retain prior context
-crew.kickoff(inputs={"topic": "What is the revenue outlook in this sector?"})
+}
+
+# The fastembed model is downloaded and loaded on first use (in build_crew), not when this script is imported,
+# and then shared by every crew
+@lru_cache(maxsize=None)
+def local_embedder_config() -> dict:
+    return {"provider": "custom", "config": {"embedder": FastEmbedEmbedder()}}
+
+# Memory classes and their storage backends
+from crewai.memory import EntityMemory, LongTermMemory, ShortTermMemory
+from crewai.memory.storage.ltm_sqlite_storage import LTMSQLiteStorage
+from crewai.memory.storage.rag_storage import RAGStorage
+from pathlib import Path
+
+# Keep the memory stores in a fixed folder next to this script, so every run (and notebook rerun)
+# loads the memories and embeddings saved by earlier runs instead of starting from an empty store
+MEMORY_DIR = Path(__file__).parent / ".crew_store"
+
+# Build a fresh set of agents, tasks and crew for one run.
+# Each concurrent run gets its own Crew and its own short-term memory store (named by run_name), so the two
+# runs never write the same task outputs or Chroma collection at once; entity and long-term memory are shared.
+def build_crew(run_name: str, verbose: bool = True) -> Crew:
+    MEMORY_DIR.mkdir(exist_ok=True)  # created on first use, not when this script is imported
+
+    # Define the research agent responsible for gathering factual data
+    research_agent = Agent(
+        role="Research Specialist",  # Agent's role
+        goal="Research interesting facts about the topic: {topic}",  # Dynamic goal based on topic
+        backstory="You are an expert at finding relevant and factual data.",  # Describes agent's personality
+        # tools=[SerperDevTool()],  # Tool for live search (currently not used)
+        verbose=verbose,  # Enables detailed output/logging
+        llm=llm           # Assigns the LLM to the agent
+    )
+
+    # Define the writer agent responsible for producing the blog summary
+    writer_agent = Agent(
+        role="Creative Writer",  # Agent's role
+        goal="Write a short blog summary using the research",  # Goal using input from research agent
+        backstory="You are skilled at writing engaging summaries based on provided content.",  # Agent’s skill description
+        llm=llm,
+        verbose=verbose
+    )
+
+    # First task: instruct research agent to find recent interesting facts
+    task1 = Task(
+        description="Find 3-5 interesting and recent facts about {topic} as of year 2025.",
+        expected_output="A bullet list of 3-5 facts",
+        agent=research_agent
+    )
+
+    # Second task: instruct writer to use the research and create a blog post
+    task2 = Task(
+        description="Write a 100-word blog post summary about {topic} using the facts from the research.",
+        expected_output="A blog post summary",
+        agent=writer_agent,
+        context=[task1]  # Uses the output from task1 as input
+    )
+
+    # Define the crew that brings together both agents and tasks
+    return Crew(
+        agents=[research_agent, writer_agent],  # List of agents in the workflow
+        tasks=[task1, task2],                   # List of tasks to perform
+        verbose=verbose,                        # Enables logging
+        memory=True,                            # Enables memory so agents retain context between tasks
+        embedder=embedder_config,               # Google text-embedding-004 embedder (https://docs.crewai.com/en/concepts/memory)
+        short_term_memory=ShortTermMemory(      # Short-term memory of this run, persisted on disk, embedded locally with fastembed
+            # Own folder: its 384-d vectors can't share a collection with 768-d Gemini vectors from earlier runs
+            storage=RAGStorage(type="short_term", embedder_config=local_embedder_config(), path=str(MEMORY_DIR / "short_term_local" / run_name))
+        ),
+        entity_memory=EntityMemory(             # Entity memory persisted on disk in MEMORY_DIR
+            storage=RAGStorage(type="entities", embedder_config=embedder_config, path=str(MEMORY_DIR))
+        ),
+        long_term_memory=LongTermMemory(        # Long-term memory (SQLite) persisted on disk in MEMORY_DIR
+            storage=LTMSQLiteStorage(db_path=str(MEMORY_DIR / "long_term_memory_storage.db"))
+        )
+    )
+
+# Run both topics concurrently; the LLM calls of the two runs overlap instead of waiting on each other.
+# The second topic is self-contained: it can't rely on the first run's memory, because both runs start together.
+# Only the first crew logs to the console; CrewAI's console printer isn't thread-safe, so two verbose crews
+# running at once would mix their output.
+async def main():
+    await asyncio.gather(
+        build_crew("ev_future").kickoff_async(inputs={"topic": "The future of electrical vehicles"}),
+        build_crew("ev_revenue_outlook", verbose=False).kickoff_async(inputs={"topic": "The revenue outlook of the electric vehicle sector"})
+    )
+
+if __name__ == "__main__":
+    asyncio.run(main())
 
 # ---------------------------------------------------------------------------------------------------------------------------------------------------------------
 
@@ -81,7 +140,10 @@ crew.kickoff(inputs={"topic": "What is the revenue outlook in this sector?"})
 
 # 2. `Model Initialization:`
 
-    # - Initializes a Gemini 2.0 Flash model via LLM() with low temperature of 0.1 (for accuracy and consistency).
+    # - Initializes a Gemini 2.0 Flash model via CachedLLM() with low temperature of 0.1 (for accuracy and consistency).
+    # - Responses aren't streamed: the two runs execute at the same time, and CrewAI's console printer for streamed
+    #   chunks isn't thread-safe. Streaming wouldn't save time either, since task2 needs task1's complete output.
+    # - CachedLLM stores responses in .llm_cache/, so rerunning the same prompts doesn't call the API again (CREW_LLM_CACHE=0 disables it).
 
 # 3. `Agent Creation:`
 
@@ -95,12 +157,19 @@ crew.kickoff(inputs={"topic": "What is the revenue outlook in this sector?"})
 
 # 5. `Crew Formation:`
 
-    # - Bundles both agents and tasks into a single crew workflow.
+    # - build_crew() bundles both agents and tasks into a single crew workflow.
     # - Enables Memory using Google’s embedding API (text-embedding-004), allowing contextual memory between runs.
+    # - Entity and long-term memory are shared in .crew_store/ next to this script; each run keeps its own short-term memory there too. All are reloaded on every run.
+    # - Short-term memory is embedded locally with fastembed (BAAI/bge-small-en-v1.5, quantized ONNX on the CPU).
+    # - Entity memory uses Google's text-embedding-004.
 
 # 6. `Execution:`
 
-    # - First Run: Topic is “The future of electrical vehicles”.
-    # - Second Run: Topic is “What is the revenue outlook in this sector?” — previous context may influence this response due to memory being enabled.
+    # - Both runs are started together with asyncio.gather() and kickoff_async(), each on its own crew with its own short-term memory.
+    # - Run 1: Topic is “The future of electrical vehicles” (verbose, logs to the console).
+    # - Run 2: Topic is “The revenue outlook of the electric vehicle sector” (verbose=False, so the two runs' logs don't get mixed).
+    # - Trade-off: running concurrently saves time, but run 2 no longer builds on run 1. Earlier versions ran them one after the
+    #   other and asked “What is the revenue outlook in this sector?”, relying on memory to resolve “this sector”.
+    #   Now the two runs only share entity and long-term memory, and only what earlier runs (previous script executions) stored there.
 
 # For more information on the memory feature, refer to the official documentation: https://docs.crewai.com/en/concepts/memory
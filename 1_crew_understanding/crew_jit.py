@@ -0,0 +1,35 @@
+# Optional Numba JIT for your own numeric post-processing hooks (scoring, dedup, re-ranking memory hits, ...).
+# Decorating a function with @crew_jit compiles it to machine code on its first call, so plain Python loops
+# over NumPy arrays run at C speed. cache=True stores the compiled code on disk (__pycache__), so scripts
+# like these, which exit after a single run, don't pay the compilation again on the next run.
+# If numba isn't installed (pip install numba), @crew_jit does nothing and the function runs as normal Python.
+
+try:
+    from numba import njit
+    crew_jit = njit(cache=True, fastmath=True, boundscheck=False)
+except ImportError:
+    def crew_jit(func):
+        return func
+
+# ✅ Example: re-rank memory hits by cosine similarity to the query embedding
+#
+#   import numpy as np
+#   from crew_jit import crew_jit
+#
+#   @crew_jit
+#   def cosine_scores(query, embeddings):          # query: float32[:], embeddings: float32[:, :]
+#       scores = np.empty(embeddings.shape[0], dtype=np.float32)
+#       query_norm = np.sqrt(np.sum(query * query))
+#       for i in range(embeddings.shape[0]):
+#           dot = 0.0
+#           norm = 0.0
+#           for j in range(embeddings.shape[1]):
+#               dot += query[j] * embeddings[i, j]
+#               norm += embeddings[i, j] * embeddings[i, j]
+#           scores[i] = dot / (query_norm * np.sqrt(norm) + 1e-12)
+#       return scores
+#
+#   order = np.argsort(-cosine_scores(query_vector, hit_vectors))  # best matches first
+#
+# Only use it on functions that work with numbers and NumPy arrays (no strings, dicts or crewai objects),
+# those are the functions Numba can compile.
@@ -0,0 +1,56 @@
+# Disk cache for LLM responses, useful while iterating on prompts and debugging crews.
+# An identical call (same model, temperature, messages and tools) returns the stored answer
+# instead of making another multi-second round-trip to the LLM API.
+# Set CREW_LLM_CACHE=0 to disable the cache (e.g. in production).
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from crewai import LLM
+
+# Folder holding one JSON file per cached response
+CACHE_DIR = Path(__file__).parent / ".llm_cache"
+CACHE_ENABLED = os.getenv("CREW_LLM_CACHE", "1") != "0"
+
+
+def cache_key(*parts) -> str:
+    """Stable SHA-256 hash of the given JSON-serializable parts."""
+    data = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def read_cache(key: str):
+    """Return the cached value for key, or None if it isn't cached."""
+    path = CACHE_DIR / f"{key}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_cache(key: str, value) -> None:
+    """Store value under key (written to a temp file first, so parallel tasks never see half a file)."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=CACHE_DIR, suffix=".tmp", delete=False, encoding="utf-8") as file:
+        json.dump(value, file)
+    os.replace(file.name, CACHE_DIR / f"{key}.json")
+
+
+class CachedLLM(LLM):
+    """crewai.LLM that caches text responses on disk, keyed on (model, temperature, messages, tools)."""
+
+    def call(self, messages, tools=None, *args, **kwargs):
+        if not CACHE_ENABLED:
+            return super().call(messages, tools, *args, **kwargs)
+
+        key = cache_key(self.model, self.temperature, messages, tools)
+        cached = read_cache(key)
+        if cached is not None:
+            return cached
+
+        response = super().call(messages, tools, *args, **kwargs)
+        if isinstance(response, str):  # only plain text answers are cached
+            write_cache(key, response)
+        return response
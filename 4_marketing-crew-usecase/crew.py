@@ -1,32 +1,98 @@
 # Type annotations and imports
+import sys
+import types
+from functools import lru_cache
 from typing import List
-from crewai import Agent, Crew, Process, Task, LLM
+import yaml
+from crewai import Agent, Crew, Process, Task
 from crewai.project import CrewBase, agent, crew, task
+from llm_cache import CachedLLM, cache_crew_planning
 
-# Import AI agent tools for search, scraping, file read/write, etc.
-from crewai_tools import SerperDevTool, ScrapeWebsiteTool, DirectoryReadTool, FileWriterTool, FileReadTool
+# AI agent tools (crewai_tools) are imported where the tools are created, not here:
+# crewai_tools pulls in a large dependency tree, which importing this module just to inspect
+# TheMarketingCrew (tests, docs) doesn't need.
 
 # Pydantic for input/output data structure validation
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 # Load environment variables (e.g., for API keys)
 from dotenv import load_dotenv
 _ = load_dotenv()
 
+# Shared HTTP connection pools, so repeated Gemini/Serper/scrape calls reuse keep-alive connections
+# instead of paying DNS + TCP + TLS setup on every request
+import httpx
+import requests
+from litellm.llms.custom_httpx.http_handler import HTTPHandler
+from requests.adapters import HTTPAdapter
+
+# Pooled client for the Gemini calls. litellm's Gemini handler only reuses connections when a client
+# is passed in (otherwise it builds a new one per call), so it's handed to the LLM below via client=...
+llm_http_client = HTTPHandler(client=httpx.Client(
+    timeout=60,
+    limits=httpx.Limits(max_connections=64, max_keepalive_connections=32)
+))
+
+tools_http_session = requests.Session()
+tools_http_session.mount("https://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+tools_http_session.mount("http://", HTTPAdapter(pool_connections=8, pool_maxsize=32))
+
+def use_shared_session(tool_class):
+    """Route the module-level requests.get/post calls of a crewai_tools tool through tools_http_session."""
+    pooled_requests = types.ModuleType("requests")
+    pooled_requests.__dict__.update(vars(requests))  # keep requests.exceptions, RequestException, ...
+    pooled_requests.get = tools_http_session.get
+    pooled_requests.post = tools_http_session.post
+    sys.modules[tool_class.__module__].requests = pooled_requests
+
 # Initialize LLM (Gemini Flash 2.0 with moderately creative output)
-llm = LLM(
+# CachedLLM stores responses on disk (.llm_cache/), so rerunning the same prompts doesn't call the API again
+llm = CachedLLM(
     model="gemini/gemini-2.0-flash",
     temperature=0.7,
+    client=llm_http_client,  # passed on to litellm.completion, so every call reuses the pooled connections
 )
 
 # Pydantic model to define structured content output format
 class Content(BaseModel):
+    # Parsed task outputs are read-only (LLM output is still fully validated against this schema)
+    model_config = ConfigDict(frozen=True)
+
     content_type: str = Field(..., description="The type of content (blog, post, video, etc.)")
     topic: str = Field(..., description="The main topic of the content")
     target_audience: str = Field(..., description="Audience to target")
     tags: List[str] = Field(..., description="Relevant tags for the content")
     content: str = Field(..., description="The actual content body")
 
+# Shared tool registry: every tool is built once and the same instances are handed to all agents.
+# Without this every agent creates its own SerperDevTool/ScrapeWebsiteTool/... instances (4 copies of each).
+@lru_cache(maxsize=None)
+def shared_tools():
+    # Import AI agent tools for search, scraping, file read/write, etc.
+    from crewai_tools import SerperDevTool, ScrapeWebsiteTool, FileWriterTool, FileReadTool
+
+    use_shared_session(SerperDevTool)
+    use_shared_session(ScrapeWebsiteTool)
+    return (
+        SerperDevTool(),
+        ScrapeWebsiteTool(),
+        FileWriterTool(),
+        FileReadTool()
+    )
+
+# One DirectoryReadTool per directory, shared by the agents that read the same folder
+@lru_cache(maxsize=None)
+def directory_tool(directory: str):
+    from crewai_tools import DirectoryReadTool
+
+    return DirectoryReadTool(directory)
+
+# Load the YAML config files with PyYAML's libyaml-based C loader when it's installed,
+# falling back to the pure-Python SafeLoader otherwise
+def load_yaml(config_path):
+    with open(config_path, "rb") as file:
+        return yaml.load(file, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+
 # Crew class definition using @CrewBase for marketing workflow
 @CrewBase
 class TheMarketingCrew():
@@ -36,23 +102,25 @@ class TheMarketingCrew():
     agents_config = 'config/agents.yaml'
     tasks_config = 'config/tasks.yaml'
 
+    # Agents don't set max_rpm: they all use the crew's single rate limiter (Crew max_rpm),
+    # so the crew as a whole stays within the quota instead of each agent separately.
+
+    # Note: @agent and @task memoize the decorated methods, so self.head_of_marketing() etc. build
+    # the Agent/Task only once per crew instance no matter how many tasks reference it.
+
     # Define marketing leader agent
     @agent
     def head_of_marketing(self) -> Agent:
         return Agent(
             config=self.agents_config['head_of_marketing'],
             tools=[
-                SerperDevTool(),
-                ScrapeWebsiteTool(),
-                DirectoryReadTool('resources/drafts'),
-                FileWriterTool(),
-                FileReadTool()
+                *shared_tools(),
+                directory_tool('resources/drafts')
             ],
             reasoning=True,
             inject_date=True,
             llm=llm,
-            allow_delegation=True,
-            max_rpm=3
+            allow_delegation=True
         )
     
     # Define social media content creator agent
@@ -61,17 +129,28 @@ class TheMarketingCrew():
         return Agent(
             config=self.agents_config['content_creator_social_media'],
             tools=[
-                SerperDevTool(),
-                ScrapeWebsiteTool(),
-                DirectoryReadTool('resources/drafts'),
-                FileWriterTool(),
-                FileReadTool()
+                *shared_tools(),
+                directory_tool('resources/drafts')
             ],
             inject_date=True,
             llm=llm,
             allow_delegation=True,
-            max_iter=30,
-            max_rpm=3
+            max_iter=30
+        )
+
+    # Define social media post writer agent (only writes the post drafts, in parallel with the blog research)
+    @agent
+    def social_media_post_writer(self) -> Agent:
+        return Agent(
+            config=self.agents_config['social_media_post_writer'],
+            tools=[
+                *shared_tools(),
+                directory_tool('resources/drafts')
+            ],
+            inject_date=True,
+            llm=llm,
+            allow_delegation=False,  # runs an async task, see TASK DEFINITIONS
+            max_iter=30
         )
 
     # Define blog content writer agent
@@ -80,17 +159,13 @@ class TheMarketingCrew():
         return Agent(
             config=self.agents_config['content_writer_blogs'],
             tools=[
-                SerperDevTool(),
-                ScrapeWebsiteTool(),
-                DirectoryReadTool('resources/drafts/blogs'),
-                FileWriterTool(),
-                FileReadTool()
+                *shared_tools(),
+                directory_tool('resources/drafts/blogs')
             ],
             inject_date=True,
             llm=llm,
-            allow_delegation=True,
-            max_iter=5,
-            max_rpm=3
+            allow_delegation=False,  # runs an async task, see TASK DEFINITIONS
+            max_iter=5
         )
 
     # Define SEO specialist agent
@@ -99,20 +174,23 @@ class TheMarketingCrew():
         return Agent(
             config=self.agents_config['seo_specialist'],
             tools=[
-                SerperDevTool(),
-                ScrapeWebsiteTool(),
-                DirectoryReadTool('resources/drafts'),
-                FileWriterTool(),
-                FileReadTool()
+                *shared_tools(),
+                directory_tool('resources/drafts')
             ],
             inject_date=True,
             llm=llm,
             allow_delegation=True,
-            max_iter=3,
-            max_rpm=3
+            max_iter=3
         )
 
     # TASK DEFINITIONS
+    # Tasks run in the order they are defined. Each task declares the outputs it depends on via context,
+    # and tasks marked async_execution=True run in parallel with the async tasks right after them
+    # (the next synchronous task waits for all of them). Tasks running in parallel use different agents,
+    # and those agents can't delegate, so no agent is ever asked to work on two tasks at once:
+    # - prepare_post_drafts has its own agent (social_media_post_writer), so content_creator_social_media
+    #   keeps delegation for the content calendar and the reel scripts.
+    # - content_writer_blogs can't delegate, which also applies to its synchronous draft_blogs task.
 
     @task
     def market_research(self) -> Task:
@@ -125,44 +203,52 @@ class TheMarketingCrew():
     def prepare_marketing_strategy(self) -> Task:
         return Task(
             config=self.tasks_config['prepare_marketing_strategy'],
-            agent=self.head_of_marketing()
+            agent=self.head_of_marketing(),
+            context=[self.market_research()]
         )
 
     @task
     def create_content_calendar(self) -> Task:
         return Task(
             config=self.tasks_config['create_content_calendar'],
-            agent=self.content_writer_social_media()
+            agent=self.content_creator_social_media(),
+            context=[self.prepare_marketing_strategy()]
         )
 
     @task
-    def prepare_post_drafts(self) -> Task:
+    def content_research_for_blogs(self) -> Task:
         return Task(
-            config=self.tasks_config['prepare_post_drafts'],
-            agent=self.content_writer_social_media(),
-            output_json=Content
+            config=self.tasks_config['content_research_for_blogs'],
+            agent=self.content_writer_blogs(),
+            context=[self.prepare_marketing_strategy(), self.create_content_calendar()],
+            async_execution=True  # runs in parallel with prepare_post_drafts
         )
 
     @task
-    def prepare_scripts_for_reels(self) -> Task:
+    def prepare_post_drafts(self) -> Task:
         return Task(
-            config=self.tasks_config['prepare_scripts_for_reels'],
-            agent=self.content_writer_social_media(),
-            output_json=Content
+            config=self.tasks_config['prepare_post_drafts'],
+            agent=self.social_media_post_writer(),
+            context=[self.create_content_calendar()],
+            output_json=Content,
+            async_execution=True  # runs in parallel with content_research_for_blogs
         )
 
     @task
-    def content_research_for_blogs(self) -> Task:
+    def draft_blogs(self) -> Task:
         return Task(
-            config=self.tasks_config['content_research_for_blogs'],
-            agent=self.content_writer_blogs()
+            config=self.tasks_config['draft_blogs'],
+            agent=self.content_writer_blogs(),
+            context=[self.content_research_for_blogs(), self.create_content_calendar()],
+            output_json=Content
         )
 
     @task
-    def draft_blogs(self) -> Task:
+    def prepare_scripts_for_reels(self) -> Task:
         return Task(
-            config=self.tasks_config['draft_blogs'],
-            agent=self.content_writer_blogs(),
+            config=self.tasks_config['prepare_scripts_for_reels'],
+            agent=self.content_creator_social_media(),
+            context=[self.prepare_marketing_strategy(), self.create_content_calendar()],
             output_json=Content
         )
 
@@ -171,6 +257,7 @@ class TheMarketingCrew():
         return Task(
             config=self.tasks_config['seo_optimization'],
             agent=self.seo_specialist(),
+            context=[self.draft_blogs()],
             output_json=Content
         )
 
@@ -178,16 +265,23 @@ class TheMarketingCrew():
     @crew
     def marketingcrew(self) -> Crew:
         """Creates the Marketing crew"""
+        # Reuse the stored execution plan when the crew is kicked off again with the same inputs,
+        # instead of asking the planning LLM for a new plan on every run
+        cache_crew_planning()
+
         return Crew(
             agents=self.agents,          # All defined agents
             tasks=self.tasks,            # All defined tasks
-            process=Process.sequential,  # Tasks run in order
+            process=Process.sequential,  # Tasks run in order (async tasks in parallel, see TASK DEFINITIONS)
             verbose=True,                # Enable detailed logs
             planning=True,               # LLM will help plan execution steps
             planning_llm=llm,
-            max_rpm=3                    # Rate limit per minute
+            max_rpm=3                    # Rate limit per minute, shared by all agents (they don't set their own max_rpm)
         )
 
+# Make CrewBase load agents.yaml/tasks.yaml through load_yaml
+TheMarketingCrew.load_yaml = staticmethod(load_yaml)
+
 
 # Run the crew if this script is executed directly
 if __name__ == "__main__":
@@ -214,13 +308,18 @@ if __name__ == "__main__":
 # 1. Environment and Model Setup
     # Loads environment variables from .env.
     # Initializes a Gemini LLM (gemini-2.0-flash) for content generation with moderate creativity.
+    # Responses are cached on disk by CachedLLM (set CREW_LLM_CACHE=0 to disable).
 
-# 2. Pydantic Model for Output
+# 2. YAML Loading
+    # agents.yaml and tasks.yaml are parsed with PyYAML's C loader when available.
+
+# 3. Pydantic Model for Output
     # Content model ensures all generated outputs (posts, blogs, etc.) are structured and validated.
 
-# 3. Agent Definitions
+# 4. Agent Definitions
     # Head of Marketing: Oversees strategy, performs research, can delegate tasks.
-    # Social Media Creator: Creates posts, scripts, content calendar.
+    # Social Media Creator: Creates scripts and the content calendar, can delegate tasks.
+    # Social Media Post Writer: Drafts the social media posts and email campaigns.
     # Blog Writer: Writes blog posts and performs related research.
     # SEO Specialist: Optimizes content for search engine visibility.
 
@@ -231,7 +330,10 @@ if __name__ == "__main__":
         # Reading/Writing files (FileReadTool/FileWriterTool)
         # Reading directories (DirectoryReadTool)
 
-# 4. Task Definitions
+    # The search/scrape/file tools (shared_tools) and directory readers (directory_tool) are created once and shared by all agents.
+    # Serper/scrape requests and the Gemini calls (client passed to the LLM) reuse pooled keep-alive HTTP connections.
+
+# 5. Task Definitions
     # Tasks cover the complete content lifecycle:
         # Market research
         # Strategy preparation
@@ -241,12 +343,15 @@ if __name__ == "__main__":
         # Blog research and writing
         # SEO optimization
 
-# 5. Crew Assembly
+# 6. Crew Assembly
     # Crew uses all agents and tasks in a sequential process.
+    # Independent tasks (blog research & social post drafts) run in parallel via async_execution,
+    # and each task only receives the outputs it needs through context.
     # Planning mode is enabled, letting LLM dynamically plan execution order and steps.
+    # The plan is cached on disk, so reruns with the same inputs skip the planning LLM call.
     # Memory isn't explicitly used, but structured content output is handled via output_json.
 
-# 6. Execution
+# 7. Execution
     # The script passes product and marketing details as input.
     # The crew is launched using .kickoff(inputs=...).
-    # Tasks are executed in order, agents work collaboratively, and results are generated.
+    # Tasks are executed in order (independent ones in parallel), agents work collaboratively, and results are generated.
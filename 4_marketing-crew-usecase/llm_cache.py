@@ -0,0 +1,101 @@
+# Disk cache for LLM responses, useful while iterating on prompts and debugging crews.
+# An identical call (same model, temperature, messages and tools) returns the stored answer
+# instead of making another multi-second round-trip to the LLM API.
+# The crew planner's plan (planning=True) can be cached the same way, see cache_crew_planning().
+# Set CREW_LLM_CACHE=0 to disable the cache (e.g. in production).
+
+import hashlib
+import json
+import os
+import tempfile
+from pathlib import Path
+
+from crewai import LLM
+
+# Folder holding one JSON file per cached response
+CACHE_DIR = Path(__file__).parent / ".llm_cache"
+CACHE_ENABLED = os.getenv("CREW_LLM_CACHE", "1") != "0"
+
+
+def cache_key(*parts) -> str:
+    """Stable SHA-256 hash of the given JSON-serializable parts."""
+    data = json.dumps(parts, sort_keys=True, default=str)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()
+
+
+def read_cache(key: str):
+    """Return the cached value for key, or None if it isn't cached."""
+    path = CACHE_DIR / f"{key}.json"
+    if not path.exists():
+        return None
+    return json.loads(path.read_text(encoding="utf-8"))
+
+
+def write_cache(key: str, value) -> None:
+    """Store value under key (written to a temp file first, so parallel tasks never see half a file)."""
+    CACHE_DIR.mkdir(exist_ok=True)
+    with tempfile.NamedTemporaryFile("w", dir=CACHE_DIR, suffix=".tmp", delete=False, encoding="utf-8") as file:
+        json.dump(value, file)
+    os.replace(file.name, CACHE_DIR / f"{key}.json")
+
+
+class CachedLLM(LLM):
+    """crewai.LLM that caches text responses on disk, keyed on (model, temperature, messages, tools)."""
+
+    def call(self, messages, tools=None, *args, **kwargs):
+        if not CACHE_ENABLED:
+            return super().call(messages, tools, *args, **kwargs)
+
+        key = cache_key(self.model, self.temperature, messages, tools)
+        cached = read_cache(key)
+        if cached is not None:
+            return cached
+
+        response = super().call(messages, tools, *args, **kwargs)
+        if isinstance(response, str):  # only plain text answers are cached
+            write_cache(key, response)
+        return response
+
+
+def cache_crew_planning() -> None:
+    """Reuse the stored plan when the crew planner (planning=True) is asked to plan the same tasks again.
+
+    The key covers everything the planner puts in its prompt: the planning model and, for each task, its
+    description, expected output and the agent's role, goal and tool names. Descriptions are interpolated
+    with the kickoff inputs before planning, so new inputs (or edited YAML) get a new plan.
+    """
+    from crewai.utilities.planning_handler import CrewPlanner, PlannerTaskPydanticOutput
+
+    plan_tasks = CrewPlanner._handle_crew_planning
+    if getattr(plan_tasks, "is_cached", False):  # already patched
+        return
+
+    def cached_plan_tasks(self):
+        if not CACHE_ENABLED:
+            return plan_tasks(self)
+
+        planning_llm = self.planning_agent_llm
+        key = cache_key(
+            "crew_planning",
+            getattr(planning_llm, "model", planning_llm),
+            [
+                (
+                    task.description,
+                    task.expected_output,
+                    task.agent.role if task.agent else None,
+                    task.agent.goal if task.agent else None,
+                    [tool.name for tool in (task.agent.tools or [])] if task.agent else None,
+                )
+                for task in self.tasks
+            ],
+        )
+        cached = read_cache(key)
+        if cached is not None:
+            return PlannerTaskPydanticOutput.model_validate(cached)
+
+        plan = plan_tasks(self)
+        write_cache(key, plan.model_dump())
+        return plan
+
+    cached_plan_tasks.is_cached = True
+    CrewPlanner._handle_crew_planning = cached_plan_tasks